@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import io
+import mmap
+import os
 import re
 import sys
+import types
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 # Try to import tomllib (Python 3.11+)
 try:
@@ -15,57 +20,91 @@ try:
 except ImportError:
     TOMLLIB_AVAILABLE = False
 
+# Prefer a native-accelerated TOML parser when installed (the 'fast' extra);
+# fall back to the stdlib pure-Python parser. Error handling below catches
+# ValueError alongside TOMLDecodeError because native parsers raise it.
+if TOMLLIB_AVAILABLE:
+    try:
+        import fasttoml
+        _toml_load = fasttoml.load
+        _toml_loads = fasttoml.loads
+    except ImportError:
+        _toml_load = tomllib.load
+        _toml_loads = tomllib.loads
 
-# Default rule settings
-DEFAULT_RULES = {
+
+# Config files larger than a page are mapped instead of read, skipping the
+# kernel-to-userspace copy; below this the mmap setup cost dominates
+_MMAP_CONFIG_THRESHOLD = 4096
+
+
+# Single source of truth for built-in rules: name -> (default, description).
+# DEFAULT_RULES and RULE_DESCRIPTIONS are derived below so the two can
+# never drift and each rule name is declared (and interned) exactly once.
+RULES: dict[str, tuple[Any, str]] = {
     # Original rules
-    'ellipsis_normalization': True,
-    'dash_conversion': True,
-    'emdash_spacing': True,
-    'quote_spacing': True,
-    'single_quote_spacing': True,
-    'cjk_english_spacing': True,
-    'cjk_parenthesis_spacing': True,
-    'space_collapsing': True,
+    'ellipsis_normalization': (True, 'Convert spaced ellipsis to standard form (. . . → ...)'),
+    'dash_conversion': (True, 'Convert dashes to Chinese em-dash between CJK text (2+ dashes → ——)'),
+    'emdash_spacing': (True, 'Fix spacing around em-dash (text——more → text —— more)'),
+    'quote_spacing': (True, 'Smart spacing around double quotes "" (avoids CJK punctuation)'),
+    'single_quote_spacing': (True, 'Smart spacing around single quotes \'\' (avoids CJK punctuation)'),
+    'cjk_english_spacing': (True, 'Add spaces between CJK and English/numbers (中文English → 中文 English)'),
+    'cjk_parenthesis_spacing': (True, 'Add spaces between CJK and half-width parentheses (中文(test) → 中文 (test))'),
+    'space_collapsing': (True, 'Collapse multiple spaces to single space (preserves indentation)'),
     # New normalization rules
-    'fullwidth_punctuation': True,
-    'fullwidth_parentheses': True,
-    'fullwidth_brackets': False,  # Optional, off by default
-    'fullwidth_alphanumeric': True,
+    'fullwidth_punctuation': (True, 'Normalize punctuation width based on context (,. → ，。 in CJK)'),
+    'fullwidth_parentheses': (True, 'Convert () to （） in CJK context'),
+    'fullwidth_brackets': (False, 'Convert [] to 【】 in CJK context'),  # Optional, off by default
+    'fullwidth_alphanumeric': (True, 'Convert full-width numbers/letters to half-width (１２３ → 123)'),
     # Cleanup rules
-    'consecutive_punctuation_limit': 0,  # 0=unlimited, 1=single, 2=double
-    'currency_spacing': True,
-    'slash_spacing': True,
+    'consecutive_punctuation_limit': (0, 'Limit consecutive punctuation (0=unlimited, 1=single, 2=double)'),
+    'currency_spacing': (True, 'Remove space between currency symbols and amounts ($ 100 → $100)'),
+    'slash_spacing': (True, 'Remove spaces around slashes (A / B → A/B, preserves URLs)'),
 }
 
+# Default rule settings
+DEFAULT_RULES = {name: spec[0] for name, spec in RULES.items()}
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to
+# plain dataclasses (same behavior, per-instance __dict__)
+if sys.version_info >= (3, 10):
+    _dataclass_opts = {'slots': True}
+else:
+    _dataclass_opts = {}
+
+# Shared immutable view of the defaults: configs loaded without any config
+# file reference it directly, avoiding a dict copy per load. Mutation paths
+# must call _ensure_mutable first; a bare RuleConfig() keeps a private
+# mutable copy so direct `config.rules[name] = value` keeps working
+_DEFAULT_RULES_PROXY = types.MappingProxyType(DEFAULT_RULES)
+
+# Known rule names for membership tests (frozenset skips the dict's value
+# slot) and the pre-sorted listing used in unknown-rule error messages
+_KNOWN_RULES = frozenset(DEFAULT_RULES)
+_KNOWN_RULES_SORTED_STR = ', '.join(sorted(DEFAULT_RULES))
+
 
 # Rule descriptions for documentation and --list-rules
-RULE_DESCRIPTIONS = {
-    'ellipsis_normalization': 'Convert spaced ellipsis to standard form (. . . → ...)',
-    'dash_conversion': 'Convert dashes to Chinese em-dash between CJK text (2+ dashes → ——)',
-    'emdash_spacing': 'Fix spacing around em-dash (text——more → text —— more)',
-    'quote_spacing': 'Smart spacing around double quotes "" (avoids CJK punctuation)',
-    'single_quote_spacing': 'Smart spacing around single quotes \'\' (avoids CJK punctuation)',
-    'cjk_english_spacing': 'Add spaces between CJK and English/numbers (中文English → 中文 English)',
-    'cjk_parenthesis_spacing': 'Add spaces between CJK and half-width parentheses (中文(test) → 中文 (test))',
-    'space_collapsing': 'Collapse multiple spaces to single space (preserves indentation)',
-    'fullwidth_punctuation': 'Normalize punctuation width based on context (,. → ，。 in CJK)',
-    'fullwidth_parentheses': 'Convert () to （） in CJK context',
-    'fullwidth_brackets': 'Convert [] to 【】 in CJK context',
-    'fullwidth_alphanumeric': 'Convert full-width numbers/letters to half-width (１２３ → 123)',
-    'consecutive_punctuation_limit': 'Limit consecutive punctuation (0=unlimited, 1=single, 2=double)',
-    'currency_spacing': 'Remove space between currency symbols and amounts ($ 100 → $100)',
-    'slash_spacing': 'Remove spaces around slashes (A / B → A/B, preserves URLs)',
-}
+RULE_DESCRIPTIONS = {name: spec[1] for name, spec in RULES.items()}
 
 
-@dataclass
+@dataclass(**_dataclass_opts)
 class RuleConfig:
     """Configuration for formatting rules."""
 
-    rules: dict[str, bool] = field(default_factory=lambda: DEFAULT_RULES.copy())
+    rules: Mapping[str, Any] = field(default_factory=lambda: DEFAULT_RULES.copy())
     custom_rules: list[dict[str, Any]] = field(default_factory=list)
 
+    def _ensure_mutable(self) -> None:
+        """Promote a shared read-only rules view to a private dict.
+
+        Configs built by load_config without any config file share the
+        immutable defaults proxy; callers that write to ``rules`` (e.g.
+        the CLI's --enable/--disable overrides) must call this first.
+        """
+        if not isinstance(self.rules, dict):
+            self.rules = dict(self.rules)
+
     def is_enabled(self, rule_name: str) -> bool:
         """Check if a rule is enabled.
 
@@ -77,6 +116,20 @@ class RuleConfig:
         """
         return self.rules.get(rule_name, True)
 
+    def fingerprint(self) -> tuple:
+        """Return a hashable summary of this configuration.
+
+        Two configs with equal fingerprints polish text identically, so
+        the fingerprint can key caches of polishing results.
+        """
+        return (
+            tuple(sorted(self.rules.items())),
+            tuple(
+                (rule.get('name'), rule.get('pattern'), rule.get('replacement'))
+                for rule in self.custom_rules
+            ),
+        )
+
     def get_value(self, rule_name: str, default: Any = None) -> Any:
         """Get the value of a rule (for non-boolean rules).
 
@@ -110,37 +163,53 @@ def load_config(config_path: Path | None = None) -> RuleConfig:
     if not TOMLLIB_AVAILABLE:
         # Fallback for Python <3.11
         # TODO: Could print warning to stderr
-        return RuleConfig()
+        return RuleConfig(rules=_DEFAULT_RULES_PROXY)
+
+    # Collect whichever config files exist, in priority order (lowest
+    # first — later entries override earlier ones when merged below).
+    # _load_toml_file stats exactly once and returns None for a missing
+    # file, so no separate exists() probe (a second stat) is needed.
+    search_paths = (
+        _user_config_path(),                      # user config
+        Path.cwd() / "cjk-text-formatter.toml",   # project config
+        config_path,                              # explicit --config (highest)
+    )
+    loaded = []
+    for path in search_paths:
+        if path is None:
+            continue
+        config_data = _load_toml_file(path)
+        if config_data:
+            loaded.append(config_data)
+
+    # No config files: share the immutable defaults, no dict copy at all
+    # (writers go through RuleConfig._ensure_mutable)
+    if not loaded:
+        return RuleConfig(rules=_DEFAULT_RULES_PROXY)
 
-    # Start with defaults
     rules = DEFAULT_RULES.copy()
-    custom_rules = []
-
-    # Load user config first (if exists)
-    user_config_path = Path.home() / ".config" / "cjk-text-formatter.toml"
-    if user_config_path.exists():
-        user_config = _load_toml_file(user_config_path)
-        if user_config:
-            _merge_config_data(rules, custom_rules, user_config)
-
-    # Load project config (overrides user config)
-    project_config_path = Path.cwd() / "cjk-text-formatter.toml"
-    if project_config_path.exists():
-        project_config = _load_toml_file(project_config_path)
-        if project_config:
-            _merge_config_data(rules, custom_rules, project_config)
-
-    # Load explicit config path (highest priority)
-    if config_path and config_path.exists():
-        explicit_config = _load_toml_file(config_path)
-        if explicit_config:
-            _merge_config_data(rules, custom_rules, explicit_config)
+    custom_rules: list[dict[str, Any]] = []
+    for config_data in loaded:
+        _merge_config_data(rules, custom_rules, config_data)
 
     return RuleConfig(rules=rules, custom_rules=custom_rules)
 
 
+def _user_config_path() -> Path:
+    """Resolve the user config file path.
+
+    Deliberately not cached: Path.home() is a cheap env lookup and callers
+    (and tests) may legitimately change HOME between invocations. The
+    CLI layer caches the fully merged config per (home, cwd, mtimes) key.
+    """
+    return Path.home() / ".config" / "cjk-text-formatter.toml"
+
+
 def _load_toml_file(file_path: Path) -> dict[str, Any] | None:
-    """Load and parse a TOML file.
+    """Load and parse a TOML file, memoized by path, mtime and size.
+
+    Repeated loads of an unchanged file (library callers, watch loops)
+    reuse the parsed result instead of re-reading and re-parsing.
 
     Args:
         file_path: Path to TOML file
@@ -149,15 +218,29 @@ def _load_toml_file(file_path: Path) -> dict[str, Any] | None:
         Parsed TOML data or None if loading fails
     """
     try:
-        with open(file_path, 'rb') as f:
-            return tomllib.load(f)
-    except (FileNotFoundError, PermissionError, tomllib.TOMLDecodeError):
+        st = os.stat(file_path)
+    except OSError:
+        # File doesn't exist or can't be stat'd
+        return None
+    return _parse_toml_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_toml_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse a TOML file; the (path, mtime, size) key invalidates on change."""
+    try:
+        with open(path_str, 'rb') as f:
+            # Large configs (many custom rules) get mapped rather than read
+            if size > _MMAP_CONFIG_THRESHOLD and hasattr(mmap, 'ACCESS_READ'):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _toml_loads(mm[:].decode('utf-8'))
+            return _toml_load(f)
+    except (FileNotFoundError, PermissionError, tomllib.TOMLDecodeError, ValueError):
         # Expected errors - file doesn't exist, can't read, or invalid TOML
         return None
     except Exception as e:
         # Unexpected error - log for debugging but don't crash
-        import sys
-        print(f"Warning: Unexpected error loading config {file_path}: {e}", file=sys.stderr)
+        print(f"Warning: Unexpected error loading config {path_str}: {e}", file=sys.stderr)
         return None
 
 
@@ -169,15 +252,40 @@ def _merge_config_data(rules: dict[str, bool], custom_rules: list, config_data:
         custom_rules: Existing custom rules list (modified in place)
         config_data: Config data to merge
     """
-    # Merge rules
+    # Merge rules. TOML parsing yields fresh key strings; sys.intern maps
+    # each onto the compiler-interned literal from RULES, so later dict
+    # probes on these keys hit pointer equality instead of comparing
+    # characters.
     if 'rules' in config_data:
         for key, value in config_data['rules'].items():
-            if key in DEFAULT_RULES:  # Only accept known rules
+            key = sys.intern(key)
+            if key in _KNOWN_RULES:  # Only accept known rules
                 rules[key] = value
 
-    # Merge custom rules
+    # Merge custom rules, pre-compiling each pattern once at load time so
+    # the polishing hot path matches with a ready re.Pattern. Rules whose
+    # pattern fails to compile are dropped here with a single warning
+    # rather than being silently re-skipped for every text polished.
     if 'custom_rules' in config_data:
-        custom_rules.extend(config_data['custom_rules'])
+        for rule in config_data['custom_rules']:
+            if '_compiled' not in rule and 'pattern' in rule:
+                # The parsed TOML is memoized, so the same rule dicts come
+                # back on later loads; the failure marker keeps a bad rule
+                # from warning again on every load_config call
+                if rule.get('_compile_failed'):
+                    continue
+                try:
+                    rule['_compiled'] = re.compile(rule['pattern'])
+                except re.error as e:
+                    rule['_compile_failed'] = True
+                    name = rule.get('name', '<unnamed>')
+                    print(
+                        f"Warning: skipping custom rule '{name}': "
+                        f"invalid regex pattern: {e}",
+                        file=sys.stderr,
+                    )
+                    continue
+            custom_rules.append(rule)
 
 
 def merge_configs(base: RuleConfig, override: RuleConfig) -> RuleConfig:
@@ -188,24 +296,58 @@ def merge_configs(base: RuleConfig, override: RuleConfig) -> RuleConfig:
         override: Override configuration
 
     Returns:
-        New RuleConfig with merged settings
+        New RuleConfig with merged settings (``base`` itself when the
+        override carries nothing to merge)
     """
-    merged_rules = base.rules.copy()
-    merged_rules.update(override.rules)
-
-    merged_custom_rules = base.custom_rules + override.custom_rules
+    # Nothing to override: return base as-is instead of copying ~16 keys
+    # (RuleConfig is treated as read-only by all callers)
+    override_rules = override.rules if override.rules is not _DEFAULT_RULES_PROXY else None
+    if not override_rules and not override.custom_rules:
+        return base
+
+    merged_rules = {**base.rules, **override.rules}
+
+    # Share whichever list is non-empty rather than concatenating into a
+    # fresh list when one side has no custom rules
+    if not base.custom_rules:
+        merged_custom_rules = override.custom_rules
+    elif not override.custom_rules:
+        merged_custom_rules = base.custom_rules
+    else:
+        merged_custom_rules = base.custom_rules + override.custom_rules
 
     return RuleConfig(rules=merged_rules, custom_rules=merged_custom_rules)
 
 
-@dataclass
+@dataclass(**_dataclass_opts)
 class ValidationResult:
     """Result of config file validation."""
 
     config_path: Path
     is_valid: bool = True
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+    # Lists are allocated lazily: the common all-valid result never touches
+    # them, so it skips two list allocations (plus their GC tracking)
+    _errors: list[str] | None = None
+    _warnings: list[str] | None = None
+
+    @property
+    def errors(self) -> list[str]:
+        """Validation errors (allocated on first access)."""
+        if self._errors is None:
+            self._errors = []
+        return self._errors
+
+    @property
+    def warnings(self) -> list[str]:
+        """Validation warnings (allocated on first access)."""
+        if self._warnings is None:
+            self._warnings = []
+        return self._warnings
+
+    def _push_error(self, message: str) -> None:
+        """Record an error and mark the result invalid."""
+        self.errors.append(message)
+        self.is_valid = False
 
     def format_report(self) -> str:
         """Format a human-readable validation report.
@@ -213,28 +355,27 @@ class ValidationResult:
         Returns:
             Formatted validation report string
         """
-        lines = [f"Validating: {self.config_path}"]
-        lines.append("")
+        # Fast path: a clean config needs no buffer (and no lists) at all
+        if self.is_valid and not self._warnings:
+            return f"Validating: {self.config_path}\n\n✓ Configuration is valid"
 
-        if self.is_valid and not self.warnings:
-            lines.append("✓ Configuration is valid")
-        else:
-            if self.errors:
-                lines.append("Errors:")
-                for error in self.errors:
-                    lines.append(f"  ✗ {error}")
-                lines.append("")
+        buf = io.StringIO()
+        buf.write(f"Validating: {self.config_path}\n")
+
+        if self._errors:
+            buf.write("\nErrors:\n")
+            for error in self._errors:
+                buf.write(f"  ✗ {error}\n")
 
-            if self.warnings:
-                lines.append("Warnings:")
-                for warning in self.warnings:
-                    lines.append(f"  ⚠ {warning}")
-                lines.append("")
+        if self._warnings:
+            buf.write("\nWarnings:\n")
+            for warning in self._warnings:
+                buf.write(f"  ⚠ {warning}\n")
 
-            if not self.errors:
-                lines.append("✓ Configuration is valid (with warnings)")
+        if not self._errors:
+            buf.write("\n✓ Configuration is valid (with warnings)")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 def validate_config(config_path: Path) -> ValidationResult:
@@ -258,88 +399,80 @@ def validate_config(config_path: Path) -> ValidationResult:
 
     # Check Python version
     if not TOMLLIB_AVAILABLE:
-        result.is_valid = False
-        result.errors.append(
+        result._push_error(
             "Config validation requires Python 3.11+ (tomllib not available)"
         )
         return result
 
     # Check if file exists
     if not config_path.exists():
-        result.is_valid = False
-        result.errors.append(f"Config file not found: {config_path}")
+        result._push_error(f"Config file not found: {config_path}")
         return result
 
     # Check if file is readable
     if not config_path.is_file():
-        result.is_valid = False
-        result.errors.append(f"Path is not a file: {config_path}")
+        result._push_error(f"Path is not a file: {config_path}")
         return result
 
     # Try to load and parse TOML
     try:
         with open(config_path, 'rb') as f:
-            config_data = tomllib.load(f)
+            config_data = _toml_load(f)
     except PermissionError:
-        result.is_valid = False
-        result.errors.append(f"Cannot read file (permission denied): {config_path}")
+        result._push_error(f"Cannot read file (permission denied): {config_path}")
         return result
-    except tomllib.TOMLDecodeError as e:
-        result.is_valid = False
-        result.errors.append(f"TOML syntax error: {e}")
+    except (tomllib.TOMLDecodeError, ValueError) as e:
+        result._push_error(f"TOML syntax error: {e}")
         return result
     except Exception as e:
-        result.is_valid = False
-        result.errors.append(f"Failed to load config: {e}")
+        result._push_error(f"Failed to load config: {e}")
         return result
 
-    # Validate built-in rules section
+    # Validate built-in rules section. Exact-type checks: the TOML parser
+    # only ever yields plain dict/list, and type(x) is dict skips the
+    # subclass/MRO logic an isinstance call has to consider.
     if 'rules' in config_data:
-        if not isinstance(config_data['rules'], dict):
-            result.is_valid = False
-            result.errors.append("'rules' section must be a table/dict")
+        if type(config_data['rules']) is not dict:
+            result._push_error("'rules' section must be a table/dict")
         else:
             # Check for unknown rule names
             for rule_name in config_data['rules']:
-                if rule_name not in DEFAULT_RULES:
-                    result.is_valid = False
-                    result.errors.append(
+                if rule_name not in _KNOWN_RULES:
+                    result._push_error(
                         f"Unknown rule name: '{rule_name}'. "
-                        f"Valid rules: {', '.join(sorted(DEFAULT_RULES.keys()))}"
+                        f"Valid rules: {_KNOWN_RULES_SORTED_STR}"
                     )
 
     # Validate custom rules section
     if 'custom_rules' in config_data:
-        if not isinstance(config_data['custom_rules'], list):
-            result.is_valid = False
-            result.errors.append("'custom_rules' must be an array of tables")
+        if type(config_data['custom_rules']) is not list:
+            result._push_error("'custom_rules' must be an array of tables")
         else:
             for i, rule in enumerate(config_data['custom_rules']):
                 rule_id = f"custom_rules[{i}]"
 
-                # Check required fields
-                if 'name' not in rule:
-                    result.is_valid = False
-                    result.errors.append(f"{rule_id}: Missing required field 'name'")
-                    continue  # Can't check other fields without name
+                # One .get per field instead of an 'in' probe plus a lookup
+                # (TOML tables never hold None, so None doubles as missing)
+                rule_name = rule.get('name')
+                pattern = rule.get('pattern')
 
-                rule_name = rule.get('name', f'rule_{i}')
+                if rule_name is None:
+                    result._push_error(f"{rule_id}: Missing required field 'name'")
+                    continue  # Can't check other fields without name
 
-                if 'pattern' not in rule:
-                    result.is_valid = False
-                    result.errors.append(f"{rule_id} ({rule_name}): Missing required field 'pattern'")
+                if pattern is None:
+                    result._push_error(f"{rule_id} ({rule_name}): Missing required field 'pattern'")
 
-                if 'replacement' not in rule:
-                    result.is_valid = False
-                    result.errors.append(f"{rule_id} ({rule_name}): Missing required field 'replacement'")
+                if rule.get('replacement') is None:
+                    result._push_error(f"{rule_id} ({rule_name}): Missing required field 'replacement'")
 
-                # Validate regex pattern if present
-                if 'pattern' in rule:
+                # Validate regex pattern if present; keep the compiled
+                # object on the rule so later use doesn't recompile
+                if pattern is not None:
                     try:
-                        re.compile(rule['pattern'])
+                        rule['_compiled'] = re.compile(pattern)
                     except re.error as e:
-                        result.is_valid = False
-                        result.errors.append(
+                        result._push_error(
                             f"{rule_id} ({rule_name}): Invalid regex pattern: {e}"
                         )
 
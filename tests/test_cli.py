@@ -0,0 +1,105 @@
+"""Tests for the command-line interface."""
+
+import pytest
+from click.testing import CliRunner
+
+from cjk_text_formatter.cli import main
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """CliRunner isolated from any user or project config file."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    return CliRunner()
+
+
+class TestStdinStreaming:
+    """Test paragraph-streaming stdin processing."""
+
+    def test_single_paragraph(self, runner):
+        result = runner.invoke(main, [], input="中文English混合\n")
+        assert result.exit_code == 0
+        assert "中文 English 混合" in result.output
+
+    def test_paragraph_breaks_preserved(self, runner):
+        text = "第一段English\n\n第二段123\n"
+        result = runner.invoke(main, [], input=text)
+        assert result.exit_code == 0
+        assert result.output == "第一段 English\n\n第二段 123\n"
+
+    def test_multiline_paragraph_kept_together(self, runner):
+        text = "第一行English\n第二行123\n"
+        result = runner.invoke(main, [], input=text)
+        assert result.exit_code == 0
+        assert result.output == "第一行 English\n第二行 123\n"
+
+    def test_verbose_accumulates_stats_across_paragraphs(self, runner):
+        text = "wait . . . one\n\nwait . . . two\n"
+        result = runner.invoke(main, ["--verbose"], input=text)
+        assert result.exit_code == 0
+        assert "2 ellipsis normalized" in result.output
+
+
+class TestJobsOption:
+    """Test the --jobs option on directory runs."""
+
+    def test_jobs_directory_run(self, runner, tmp_path):
+        for i in range(3):
+            (tmp_path / f"file{i}.txt").write_text("中文English混合\n")
+
+        result = runner.invoke(main, [str(tmp_path), "--inplace", "-j", "2"])
+        assert result.exit_code == 0
+        for i in range(3):
+            assert (tmp_path / f"file{i}.txt").read_text() == "中文 English 混合"
+
+    def test_jobs_rejects_zero(self, runner, tmp_path):
+        result = runner.invoke(main, [str(tmp_path), "--inplace", "-j", "0"])
+        assert result.exit_code != 0
+
+
+class TestStatsOnly:
+    """Test --dry-run --stats-only output."""
+
+    def test_stats_without_formatted_output(self, runner, tmp_path):
+        test_file = tmp_path / "doc.txt"
+        test_file.write_text("中文English混合\n")
+
+        result = runner.invoke(main, [str(test_file), "--dry-run", "--stats-only"])
+        assert result.exit_code == 0
+        assert "CJK-English spacing added" in result.output
+        # The polished content itself is not echoed
+        assert "中文 English 混合" not in result.output
+
+    def test_dry_run_without_stats_only_shows_content(self, runner, tmp_path):
+        test_file = tmp_path / "doc.txt"
+        test_file.write_text("中文English混合\n")
+
+        result = runner.invoke(main, [str(test_file), "--dry-run"])
+        assert result.exit_code == 0
+        assert "中文 English 混合" in result.output
+
+
+class TestUnchangedFileSkip:
+    """Test that already-formatted files are not rewritten."""
+
+    def test_single_file_reports_unchanged(self, runner, tmp_path):
+        test_file = tmp_path / "clean.txt"
+        test_file.write_text("中文 English 混合")
+
+        result = runner.invoke(main, [str(test_file), "--inplace"])
+        assert result.exit_code == 0
+        assert "Unchanged" in result.output
+
+    def test_directory_run_skips_unchanged_write(self, runner, tmp_path):
+        clean = tmp_path / "clean.txt"
+        clean.write_text("中文 English 混合")
+        dirty = tmp_path / "dirty.txt"
+        dirty.write_text("中文English混合")
+        mtime_before = clean.stat().st_mtime_ns
+
+        result = runner.invoke(main, [str(tmp_path), "--inplace"])
+        assert result.exit_code == 0
+        assert "(unchanged)" in result.output
+        assert clean.stat().st_mtime_ns == mtime_before
+        assert dirty.read_text() == "中文 English 混合"
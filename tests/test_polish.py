@@ -1,13 +1,16 @@
 """Tests for text polishing functions."""
 
 import pytest
+from cjk_text_formatter.config import RuleConfig
 from cjk_text_formatter.polish import (
     polish_text,
+    compile_polisher,
     contains_cjk,
     _replace_dash,
     _fix_emdash_spacing,
     _fix_quotes,
     _fix_single_quotes,
+    _fix_currency_spacing,
     _space_between,
     _normalize_ellipsis,
 )
@@ -494,3 +497,63 @@ class TestPolishText:
         assert "。他" in result or "。 他" in result  # Period handling
         assert "《人生》—— 一部" in result  # Dash converts between CJK (closing quote, no left space)
         assert "2018 年" in result  # Number-Chinese spacing
+
+
+class TestCurrencySpacing:
+    """Test space removal between currency symbols/codes and amounts."""
+
+    def test_symbol_before_amount(self):
+        assert _fix_currency_spacing("$ 100") == "$100"
+        assert _fix_currency_spacing("¥ 500") == "¥500"
+
+    def test_currency_code_before_amount(self):
+        assert _fix_currency_spacing("USD 5") == "USD5"
+        assert _fix_currency_spacing("EUR 20") == "EUR20"
+
+    def test_stray_capital_not_treated_as_currency(self):
+        """A lone capital letter must not have its following space eaten."""
+        assert _fix_currency_spacing("计划C 5次") == "计划C 5次"
+        assert _fix_currency_spacing("B\u30001") == "B\u30001"
+
+    def test_currency_in_cjk_context(self):
+        assert polish_text("共$ 100元") == "共 $100 元"
+        # The stray-capital space survives the full pipeline too
+        assert polish_text("计划C 5次") == "计划 C 5 次"
+
+
+class TestCompilePolisher:
+    """Test config-specialized polishing closures."""
+
+    SAMPLES = [
+        "wait . . . more",
+        "中文English混合，数字123也包含。",
+        "《书名》——作者说\u201c你好\u201d啊",
+        "文本    太多    空格  ",
+        "plain English text",
+    ]
+
+    def test_matches_polish_text_default_config(self):
+        polish = compile_polisher()
+        for text in self.SAMPLES:
+            assert polish(text) == polish_text(text)
+
+    def test_matches_polish_text_with_disabled_rule(self):
+        config = RuleConfig()
+        config.rules["dash_conversion"] = False
+        polish = compile_polisher(config)
+        text = "中文--测试"
+        assert polish(text) == polish_text(text, config)
+        assert "——" not in polish(text)
+
+    def test_explicit_is_cjk_hint(self):
+        polish = compile_polisher()
+        text = "中文English混合"
+        assert polish(text, is_cjk=True) == polish_text(text, is_cjk=True)
+        # is_cjk=False skips the CJK rules entirely
+        assert polish(text, is_cjk=False) == text
+
+    def test_closure_memoized_per_fingerprint(self):
+        assert compile_polisher() is compile_polisher()
+        config = RuleConfig()
+        config.rules["quote_spacing"] = False
+        assert compile_polisher(config) is compile_polisher(RuleConfig(rules=dict(config.rules)))
@@ -1,5 +1,7 @@
 """Tests for file processors."""
 
+import os
+
 import pytest
 from pathlib import Path
 from cjk_text_formatter.processors import (
@@ -8,6 +10,7 @@ from cjk_text_formatter.processors import (
     HTMLProcessor,
     process_file,
     find_files,
+    write_text_fast,
 )
 
 
@@ -280,3 +283,32 @@ class TestFindFiles:
         non_existent = tmp_path / "does_not_exist"
         with pytest.raises(FileNotFoundError):
             find_files(non_existent)
+
+
+class TestWriteTextFast:
+    """Test the fast write helper, including atomic replacement."""
+
+    def test_plain_write(self, tmp_path):
+        target = tmp_path / "out.txt"
+        write_text_fast(target, "中文 English\n")
+        assert target.read_text(encoding="utf-8") == "中文 English\n"
+
+    def test_atomic_write_replaces_content(self, tmp_path):
+        target = tmp_path / "out.txt"
+        target.write_text("old")
+        write_text_fast(target, "new content", atomic=True)
+        assert target.read_text(encoding="utf-8") == "new content"
+        # No temp file left behind
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_atomic_write_preserves_permissions(self, tmp_path):
+        target = tmp_path / "secret.txt"
+        target.write_text("old")
+        os.chmod(target, 0o600)
+        write_text_fast(target, "new", atomic=True)
+        assert os.stat(target).st_mode & 0o777 == 0o600
+
+    def test_atomic_write_creates_new_file(self, tmp_path):
+        target = tmp_path / "fresh.txt"
+        write_text_fast(target, "content", atomic=True)
+        assert target.read_text(encoding="utf-8") == "content"